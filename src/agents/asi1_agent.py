@@ -22,7 +22,7 @@ from ..models.requests import ASI1Request
 from ..models.responses import ASI1Response
 
 # Import the improved ASI1 service
-from ..services.llm_service import ASI1Service, LLMError, TradingSignal
+from ..services.llm_service import ASI1Service, LLMError, TradingSignal, get_asi1_service
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -71,8 +71,9 @@ class ASI1ReasoningAgent:
             endpoint=[self.config.endpoint],
         )
         
-        # Initialize the ASI1 service
-        self.asi1_service = ASI1Service()
+        # Use the shared ASI1 service so the HTTP pool and response
+        # cache are reused across the process
+        self.asi1_service = get_asi1_service()
         
         # Register message handlers
         self.agent.on_event("startup")(self.on_startup)
@@ -10,6 +10,7 @@ and manages staking of tokens with validators.
 import logging
 import os
 import sys
+from functools import lru_cache
 from typing import Dict, Any
 
 from cosmpy.aerial.client import LedgerClient
@@ -28,6 +29,18 @@ from ..utils.errors import BlockchainError
 from ..utils.logging import log_exception
 
 
+@lru_cache(maxsize=128)
+def _addr(address: str) -> Address:
+    """
+    Return a cached Address wrapper for a bech32 address string.
+
+    Address() re-parses and checksums the bech32 string on every
+    construction; caching avoids that work for repeated balance queries
+    against the same addresses (typically the agent's own wallet).
+    """
+    return Address(address)
+
+
 class RewardAgent(BaseAgent):
     """
     Agent that handles reward payments and staking.
@@ -50,7 +63,11 @@ class RewardAgent(BaseAgent):
         
         # Initialize ledger client
         self.ledger: LedgerClient = get_ledger()
-        
+
+        # Cache the parsed wallet address; it never changes for the lifetime
+        # of the agent and is used on every balance query
+        self._own_address: Address = _addr(str(self.agent.wallet.address()))
+
         # Ensure agent has enough funds to operate
         fund_agent_if_low(self.agent.wallet.address(), min_balance=self.AMOUNT)
     
@@ -182,7 +199,7 @@ class RewardAgent(BaseAgent):
         try:
             # Get current balance in atestfet
             wallet_address = self.agent.wallet.address()
-            agent_balance = self.ledger.query_bank_balance(Address(wallet_address))
+            agent_balance = self.ledger.query_bank_balance(self._own_address)
             
             if agent_balance <= 0:
                 self.logger.info("No tokens to stake")
@@ -225,7 +242,7 @@ class RewardAgent(BaseAgent):
         """
         try:
             # Query balance in atestfet (1 TESTFET = 10^18 atestfet)
-            balance_atestfet = self.ledger.query_bank_balance(Address(address))
+            balance_atestfet = self.ledger.query_bank_balance(_addr(str(address)))
             
             # Convert to TESTFET
             balance_testfet = balance_atestfet / 1_000_000_000_000_000_000
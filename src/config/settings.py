@@ -6,7 +6,9 @@ environment variables, with appropriate type conversions and default values.
 """
 
 import os
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from dotenv import load_dotenv
 
@@ -21,6 +23,9 @@ AGENTVERSE_API_KEY: str = os.getenv("AGENTVERSE_API_KEY", "")
 # Blockchain Configuration
 METAMASK_PRIVATE_KEY: str = os.getenv("METAMASK_PRIVATE_KEY", "")
 BASE_RPC_URL: str = os.getenv("BASE_RPC_URL", "https://mainnet.base.org")
+# Optional WebSocket endpoint; when set, transaction receipts are awaited
+# via newHeads subscriptions instead of HTTP polling
+BASE_WSS_URL: str = os.getenv("BASE_WSS_URL", "")
 
 # Agent Seeds
 MAIN_AGENT_SEED: str = os.getenv("MAIN_AGENT_SEED", "this_is_main_agent_to_run")
@@ -67,7 +72,9 @@ UNIVERSAL_ROUTER_ADDRESS: str = "0x3fC91A3afd70395Cd496C647d5a6CC9D4B2b7FAD"  #
 BASE_CHAIN_ID: int = 8453
 
 # Default Agent Configuration
-DEFAULT_AGENT_CONFIG: Dict[str, str] = {
+# Wrapped in a read-only view so shared configuration cannot be mutated
+# accidentally by one agent and leak into another.
+DEFAULT_AGENT_CONFIG: Mapping[str, Dict[str, str]] = MappingProxyType({
     "main": {
         "name": MAIN_AGENT_NAME,
         "port": str(MAIN_AGENT_PORT),
@@ -92,11 +99,17 @@ DEFAULT_AGENT_CONFIG: Dict[str, str] = {
         "seed": USDC_ETH_AGENT_SEED,
         "endpoint": f"http://127.0.0.1:{USDC_ETH_AGENT_PORT}/api/webhook",
     },
-}
+})
 
 # Check if required API keys are available
+@lru_cache(maxsize=1)
 def validate_api_keys() -> None:
-    """Validate that required API keys are set."""
+    """
+    Validate that required API keys are set.
+
+    The result is memoized: the keys are read once at import time, so after
+    the first successful validation repeated calls are a single cache lookup.
+    """
     missing_keys = []
     
     if not ASI1_API_KEY:
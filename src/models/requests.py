@@ -7,36 +7,56 @@ These models represent structured data exchanged between agents.
 """
 
 from typing import Optional, List
+
 from uagents import Model
 
 
+class FrozenConfig:
+    """
+    Shared pydantic config: messages are immutable once constructed, which
+    keeps them safe to pass between agent handlers without copies.
+
+    uagents' Model is built on pydantic v1, so the freeze uses the v1
+    allow_mutation switch rather than the v2 ConfigDict(frozen=True).
+    """
+    allow_mutation = False
+
+
 class CoinRequest(Model):
     """Request for cryptocurrency information."""
+    Config = FrozenConfig
+
     blockchain: str
 
 
 class CryptonewsRequest(Model):
     """
     Request model for cryptocurrency news.
-    
+
     Attributes:
         limit: Maximum number of news items to retrieve
     """
+    Config = FrozenConfig
+
     limit: Optional[int] = 1
 
 
 class ASI1Request(Model):
     """
     Request model for ASI1 reasoning agent.
-    
+
     Attributes:
         query: The analysis query with market data
     """
+    Config = FrozenConfig
+
     query: str
 
 
 class FGIRequest(Model):
     """Request for Fear and Greed Index information."""
+    Config = FrozenConfig
+
     limit: Optional[int] = 1
     ready: str = "ready"
 
@@ -44,12 +64,14 @@ class FGIRequest(Model):
 class SwaplandRequest(Model):
     """
     Model for swap requests.
-    
+
     Attributes:
         blockchain: The blockchain to perform the swap on
         signal: The trading signal (BUY/SELL/HOLD)
         amount: The amount to swap
     """
+    Config = FrozenConfig
+
     blockchain: str
     signal: str
     amount: float
@@ -57,28 +79,38 @@ class SwaplandRequest(Model):
 
 class NewsRequest(Model):
     """Request for cryptocurrency news."""
+    Config = FrozenConfig
+
     coin: Optional[str] = None
     ready: str = "ready"
 
 
 class PaymentInquiry(Model):
     """Payment inquiry message to start a payment process."""
+    Config = FrozenConfig
+
     ready: str = "ready"
 
 
 class RewardRequest(Model):
     """Request for reward information."""
+    Config = FrozenConfig
+
     ready: str = "ready"
 
 
 class TopupRequest(Model):
     """Request for token top-up."""
+    Config = FrozenConfig
+
     wallet_address: str
     amount: Optional[int] = None
 
 
 class SwapRequest(Model):
     """Request for cryptocurrency swap."""
+    Config = FrozenConfig
+
     blockchain: str
     signal: str  # "buy" or "sell"
-    amount: float 
\ No newline at end of file
+    amount: float
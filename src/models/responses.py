@@ -6,14 +6,18 @@ This module defines the response models used by the agents in the system.
 These models represent structured data exchanged between agents.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
 from uagents import Model
 
+from .requests import FrozenConfig
+
 
 class CoinResponse(Model):
     """
     Response model with cryptocurrency market data.
-    
+
     Attributes:
         name: Name of the cryptocurrency
         symbol: Symbol of the cryptocurrency (e.g., BTC, ETH)
@@ -22,6 +26,8 @@ class CoinResponse(Model):
         total_volume: Trading volume in USD
         price_change_24h: Price change in last 24 hours (percentage)
     """
+    Config = FrozenConfig
+
     name: str
     symbol: str
     current_price: float
@@ -33,32 +39,38 @@ class CoinResponse(Model):
 class CryptonewsResponse(Model):
     """
     Response model with cryptocurrency news updates.
-    
+
     Attributes:
         cryptoupdates: String containing recent crypto news
     """
+    Config = FrozenConfig
+
     cryptoupdates: str
 
 
 class ASI1Response(Model):
     """
     Response model from ASI1 reasoning agent with trading decision.
-    
+
     Attributes:
         decision: The trading decision (BUY/SELL/HOLD)
     """
+    Config = FrozenConfig
+
     decision: str
 
 
 class FearGreedData(Model):
     """
     Model representing Fear & Greed Index data for a single day.
-    
+
     Attributes:
         value: Numeric value of the index (0-100)
         value_classification: Classification of the value (e.g., Extreme Fear, Fear, Neutral, Greed, Extreme Greed)
         timestamp: ISO format timestamp
     """
+    Config = FrozenConfig
+
     value: float
     value_classification: str
     timestamp: str
@@ -67,35 +79,68 @@ class FearGreedData(Model):
 class FGIResponse(Model):
     """
     Response model with Fear & Greed Index data.
-    
+
     Attributes:
-        data: List of FearGreedData objects
+        data: Tuple of FearGreedData objects
         status: Status of the response (e.g., "success")
         timestamp: ISO format timestamp
     """
-    data: List[FearGreedData]
+    Config = FrozenConfig
+
+    data: Tuple[FearGreedData, ...]
     status: str
     timestamp: str
 
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert the index series to structure-of-arrays form for analysis.
+
+        Consumers that aggregate the series (mean, stddev, windowed
+        sentiment) should use these arrays so the reductions run as NumPy
+        vector operations instead of Python loops over FearGreedData objects.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: values (float32),
+            classifications (str) and timestamps (datetime64[s]) arrays
+        """
+        values = np.fromiter((d.value for d in self.data), dtype=np.float32, count=len(self.data))
+        classifications = np.array([d.value_classification for d in self.data])
+
+        # The live index API reports timestamps as epoch-second strings,
+        # which numpy would otherwise parse as years ("1714608000" becomes
+        # the year 1714608000); mock/error paths use ISO strings instead
+        raw = [d.timestamp for d in self.data]
+        if raw and all(ts.lstrip("-").isdigit() for ts in raw):
+            timestamps = np.array(raw, dtype=np.int64).astype("datetime64[s]")
+        else:
+            timestamps = np.array(raw, dtype="datetime64[s]")
+        return values, classifications, timestamps
+
 
 class SwaplandResponse(Model):
     """
     Model for swap responses.
-    
+
     Attributes:
         status: The status of the swap operation
     """
+    Config = FrozenConfig
+
     status: str
 
 
 class NewsResponse(Model):
     """Response with cryptocurrency news articles."""
+    Config = FrozenConfig
+
     articles: List[Dict[str, Any]]
     status: str = "ok"
 
 
 class PaymentRequest(Model):
     """Payment request details sent by the reward agent."""
+    Config = FrozenConfig
+
     wallet_address: str
     amount: int
     denom: str
@@ -103,16 +148,22 @@ class PaymentRequest(Model):
 
 class TransactionInfo(Model):
     """Transaction information sent to confirm a payment."""
+    Config = FrozenConfig
+
     tx_hash: str
 
 
 class PaymentReceived(Model):
     """Confirmation that a payment was received."""
+    Config = FrozenConfig
+
     status: str
 
 
 class TopupResponse(Model):
     """Response to a token top-up request."""
+    Config = FrozenConfig
+
     status: str
     transaction_hash: Optional[str] = None
     balance: Optional[float] = None
@@ -120,6 +171,8 @@ class TopupResponse(Model):
 
 class SwapResponse(Model):
     """Response to a swap request."""
+    Config = FrozenConfig
+
     status: str  # "success", "error", "pending"
     message: Optional[str] = None
-    transaction_hash: Optional[str] = None 
\ No newline at end of file
+    transaction_hash: Optional[str] = None
@@ -5,14 +5,35 @@ ASI1 API Service
 This module provides functions to interact with the ASI1 LLM API for AI reasoning.
 """
 
+import json
 import os
 import logging
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, Optional
 
 from ..utils.errors import APIError
 from ..utils.logging import log_exception
-from ..config.settings import ASI1_API_KEY
+from ..config.settings import ASI1_API_KEY, DEFAULT_TIMEOUT, MAX_RETRIES
+
+# Connection timeout for the ASI1 API; the read timeout is DEFAULT_TIMEOUT.
+CONNECT_TIMEOUT: float = 5.0
+
+# Shared session with retries for transient upstream failures, so a single
+# hung or flaky ASI1 call cannot stall an agent indefinitely.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+        )
+    ),
+)
 
 
 def query_llm(prompt: str) -> str:
@@ -48,14 +69,19 @@ def query_llm(prompt: str) -> str:
     logger = logging.getLogger("service.asi1")
     
     try:
-        logger.debug(f"Sending request to ASI1 API: {prompt[:100]}...")
-        response = requests.post(url, headers=headers, json=data)
+        logger.debug("Sending request to ASI1 API: %.100s...", prompt)
+        response = _SESSION.post(
+            url,
+            headers=headers,
+            json=data,
+            timeout=(CONNECT_TIMEOUT, DEFAULT_TIMEOUT),
+        )
         response.raise_for_status()
         
         output = response.json()
         content = output["choices"][0]["message"]["content"]
         
-        logger.debug(f"Received response from ASI1 API: {content[:100]}...")
+        logger.debug("Received response from ASI1 API: %.100s...", content)
         return content
         
     except requests.exceptions.RequestException as e:
@@ -67,6 +93,91 @@ def query_llm(prompt: str) -> str:
         raise APIError(f"Invalid response from ASI1 LLM: {e}")
 
 
+def stream_llm(prompt: str) -> Iterator[str]:
+    """
+    Streams the ASI1-Mini LLM response for a given prompt, chunk by chunk.
+
+    Uses the server-sent events (SSE) streaming mode of the chat completions
+    API so callers can start consuming content before generation finishes.
+
+    Args:
+        prompt: The input question or statement for the language model
+
+    Yields:
+        str: Successive content fragments of the LLM response
+
+    Raises:
+        APIError: If the request to the LLM API fails
+    """
+    api_key = ASI1_API_KEY
+    if not api_key:
+        raise APIError("ASI1_API_KEY is not set in environment variables")
+
+    url = "https://api.asi1.ai/v1/chat/completions"
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+
+    data = {
+        "messages": [{"role": "user", "content": prompt}],
+        "conversationId": None,
+        "model": "asi1-mini",
+        "stream": True
+    }
+
+    logger = logging.getLogger("service.asi1")
+
+    try:
+        logger.debug("Streaming request to ASI1 API: %.100s...", prompt)
+        response = _SESSION.post(
+            url,
+            headers=headers,
+            json=data,
+            stream=True,
+            timeout=(CONNECT_TIMEOUT, DEFAULT_TIMEOUT),
+        )
+        response.raise_for_status()
+
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data: "):
+                continue
+
+            payload = line[len("data: "):]
+            if payload == "[DONE]":
+                break
+
+            chunk = json.loads(payload)
+            content = chunk["choices"][0].get("delta", {}).get("content")
+            if content:
+                yield content
+
+    except requests.exceptions.RequestException as e:
+        log_exception(logger, e, "ASI1 API streaming request failed")
+        raise APIError(f"Failed to stream from ASI1 LLM: {e}")
+
+    except (KeyError, IndexError, json.JSONDecodeError) as e:
+        log_exception(logger, e, "Invalid streaming response format from ASI1 API")
+        raise APIError(f"Invalid streaming response from ASI1 LLM: {e}")
+
+
+def query_llm_streamed(prompt: str) -> str:
+    """
+    Queries the LLM via the streaming endpoint and returns the full response.
+
+    Args:
+        prompt: The input question or statement for the language model
+
+    Returns:
+        str: The concatenated response from the LLM
+
+    Raises:
+        APIError: If the request to the LLM API fails
+    """
+    return "".join(stream_llm(prompt))
+
+
 def analyze_crypto_sentiment(news_data: Dict[str, Any], price_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyzes cryptocurrency sentiment using the ASI1 LLM.
@@ -106,8 +217,38 @@ def analyze_crypto_sentiment(news_data: Dict[str, Any], price_data: Dict[str, An
     }}
     """
     
-    response = query_llm(prompt)
-    
+    # Stream the response and stop as soon as the JSON object closes, so we
+    # are not waiting on trailing prose the model may append after the JSON.
+    # Braces inside string values don't count, so the scanner tracks
+    # in-string and escape state while walking the fragments.
+    parts = []
+    depth = 0
+    seen_object = False
+    in_string = False
+    escaped = False
+
+    for fragment in stream_llm(prompt):
+        parts.append(fragment)
+
+        for char in fragment:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = in_string
+            elif char == '"':
+                in_string = not in_string
+            elif not in_string:
+                if char == "{":
+                    depth += 1
+                    seen_object = True
+                elif char == "}":
+                    depth -= 1
+
+        if seen_object and depth <= 0 and not in_string:
+            break
+
+    response = "".join(parts)
+
     # In a production system, you'd properly parse this as JSON
     # For simplicity, we're returning the raw response for now
     return {
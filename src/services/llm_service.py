@@ -6,19 +6,24 @@ model API, specifically designed for analyzing cryptocurrency market data and
 generating trading signals.
 """
 
-import json
+import asyncio
+import functools
+import hashlib
 import logging
 import os
+import re
 import sys
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import aiohttp
 import backoff
+import orjson
 import requests
 from dotenv import load_dotenv
-from pydantic import BaseModel, ValidationError, validator
+from pydantic import BaseModel
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -60,23 +65,26 @@ class Message(BaseModel):
     content: str
 
 
-class LLMResponse(BaseModel):
-    """Model for validating LLM API responses."""
-    choices: List[Dict[str, Any]]
-    
-    @validator('choices')
-    def validate_choices(cls, choices):
-        """Validate that the choices field contains at least one item with the expected structure."""
-        if not choices or len(choices) == 0:
-            raise ValueError("No choices in response")
-        
-        if "message" not in choices[0]:
-            raise ValueError("No message in first choice")
-            
-        if "content" not in choices[0]["message"]:
-            raise ValueError("No content in message")
-            
-        return choices
+def _extract_content(output: Dict[str, Any]) -> str:
+    """
+    Pull the message content out of a chat completions payload.
+
+    Only choices[0].message.content is ever used, so a direct dict probe
+    avoids building and validating a Pydantic model per response.
+
+    Args:
+        output: The decoded JSON response from the API
+
+    Returns:
+        str: The message content
+
+    Raises:
+        APIResponseError: If the payload does not have the expected shape
+    """
+    try:
+        return output["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError) as e:
+        raise APIResponseError(f"Unexpected response structure: {e}")
 
 
 class TradingSignal(Enum):
@@ -87,6 +95,91 @@ class TradingSignal(Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Matches the first trading signal token in an LLM response. A single
+# compiled case-insensitive scan avoids upper-casing the whole response and
+# running three separate substring searches over it.
+_SIGNAL_RE = re.compile(r"\b(BUY|SELL|HOLD)\b", re.IGNORECASE)
+
+
+class LLMCache:
+    """
+    Small TTL cache for LLM responses keyed by the exact request payload.
+
+    Market snapshots repeat frequently within short windows (the same
+    coin/FGI/news tuple analyzed more than once), and for identical prompts
+    the network call and API spend are pure waste. Entries expire after
+    `ttl` seconds so stale market conditions are never served.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Time-to-live for each entry, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[float, str]] = {}
+
+    @staticmethod
+    def key_for(payload: Dict[str, Any]) -> str:
+        """Compute a stable cache key for a request payload."""
+        return hashlib.sha256(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            if time.time() - stored_at < self.ttl:
+                self.hits += 1
+                return content
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, content: str) -> None:
+        """Store a response, evicting the oldest entry if the cache is full."""
+        if len(self._entries) >= self.maxsize:
+            oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest_key]
+        self._entries[key] = (time.time(), content)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for observability."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# Retry policy for LLM API calls. backoff evaluates max_tries at decoration
+# time, so this must be a constant rather than a per-instance config lookup.
+MAX_LLM_TRIES = 3
+MAX_RETRY_TIME = 60.0
+
+# Market-analysis prompt, built once at import. The data sections are filled
+# with compact JSON rather than dict repr, which keeps the outbound payload
+# smaller and the bytes deterministic for the response cache key.
+MARKET_PROMPT_TEMPLATE = """
+Consider the following factors:
+
+Fear Greed Index Analysis - {fgi}
+Coin Market Data - {coin}
+User's type of investing - {investor}
+User's risk strategy - {risk}
+
+Most recent crypto news - {news}
+
+You are a crypto expert, who is assisting the user to make the most meaningful decisions, to gain the most revenue.
+Given the following information, respond with one word, either "SELL", "BUY" or "HOLD" native token from {chain} network.
+"""
+
+
 @dataclass
 class ASI1Config:
     """Configuration for the ASI1 LLM service."""
@@ -132,15 +225,75 @@ class ASI1Service:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
-        
+
+        # Reuse a single pooled session for all API calls so each query does
+        # not pay a fresh TCP + TLS handshake; the hot path is network-bound
+        # and dominated by connection setup otherwise
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=0
+        )
+        self._session.mount("https://", adapter)
+
+        # Async session is created lazily on first use so the service can be
+        # constructed outside of a running event loop
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
+        # Short-TTL exact-match cache so repeated market snapshots do not pay
+        # for a fresh LLM round-trip
+        self.cache = LLMCache()
+
         logger.info("ASI1 LLM service initialized")
+
+    def close(self) -> None:
+        """Close the pooled HTTP session held by the service."""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP session, if one was created."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+
+    async def _get_aio_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on first use.
+
+        The connector caps the pool at a few warm keep-alive connections to
+        the single ASI1 host, so a concurrent batch of analyses reuses
+        established TLS sessions instead of opening one socket per query.
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=20,
+                keepalive_timeout=60.0,
+            )
+            self._aio_session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                # Requests are posted as pre-encoded orjson bytes, but keep
+                # any json= usage on this session off the stdlib encoder too
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+        return self._aio_session
+
+    def __enter__(self) -> "ASI1Service":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.close()
     
     @backoff.on_exception(
         backoff.expo,
         (APIConnectionError, RateLimitError),
-        max_tries=lambda self: self.config.max_retries,
+        max_tries=MAX_LLM_TRIES,
+        max_time=MAX_RETRY_TIME,
+        jitter=backoff.full_jitter,
         on_backoff=lambda details: logger.warning(
-            f"Retrying API call (attempt {details['tries']}/{self.config.max_retries})"
+            "Retrying API call (attempt %s/%s)", details["tries"], MAX_LLM_TRIES
         )
     )
     def query_llm(self, query: str) -> str:
@@ -161,7 +314,6 @@ class ASI1Service:
             APIConnectionError: If connection to the API fails
             APIResponseError: If the API response is invalid
             RateLimitError: If the API rate limit is exceeded
-            ValidationFailedError: If response validation fails
         """
         logger.info(f"Querying ASI1 LLM with prompt (length: {len(query)} chars)")
         
@@ -171,16 +323,24 @@ class ASI1Service:
             "conversationId": self.config.conversation_id,
             "model": self.config.model
         }
-        
+
+        # Serve identical prompts from the cache instead of the network
+        cache_key = LLMCache.key_for(data)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("LLM cache hit; skipping API call")
+            return cached
+
         try:
             # Send the request to the API
             logger.debug(f"Sending request to {self.config.api_url}")
             start_time = time.time()
             
-            response = requests.post(
+            # orjson serializes the payload in C; the session already carries
+            # the application/json content type
+            response = self._session.post(
                 self.config.api_url,
-                headers=self.headers,
-                json=data,
+                data=orjson.dumps(data),
                 timeout=self.config.timeout
             )
             
@@ -201,23 +361,14 @@ class ASI1Service:
                 raise APIResponseError(f"API returned error: {response.status_code} - {response.text}")
             
             # Parse the response
-            output = response.json()
-            
-            # Validate the response structure
-            try:
-                validated_response = LLMResponse(**output)
-                content = validated_response.choices[0]["message"]["content"]
-                logger.info(f"Received valid response (length: {len(content)} chars)")
-                return content
-            
-            except ValidationError as e:
-                logger.error(f"Response validation failed: {e}")
-                raise ValidationFailedError(f"API response validation failed: {e}")
-            
-            except (KeyError, IndexError) as e:
-                logger.error(f"Unexpected response structure: {e}")
-                raise APIResponseError(f"Unexpected response structure: {e}")
-        
+            output = orjson.loads(response.content)
+
+            # Probe the expected structure directly
+            content = _extract_content(output)
+            logger.info(f"Received valid response (length: {len(content)} chars)")
+            self.cache.set(cache_key, content)
+            return content
+
         except requests.exceptions.Timeout:
             logger.error(f"Request timed out after {self.config.timeout} seconds")
             raise APIConnectionError(f"Request timed out after {self.config.timeout} seconds")
@@ -230,7 +381,7 @@ class ASI1Service:
             logger.error(f"Request error: {e}")
             raise APIConnectionError(f"Request failed: {e}")
         
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse response as JSON: {e}")
             raise APIResponseError(f"Invalid JSON response: {e}")
         
@@ -238,33 +389,110 @@ class ASI1Service:
             logger.error(f"Unexpected error: {e}")
             raise LLMError(f"Unexpected error: {e}")
     
+    @backoff.on_exception(
+        backoff.expo,
+        (APIConnectionError, RateLimitError),
+        max_tries=MAX_LLM_TRIES,
+        max_time=MAX_RETRY_TIME,
+        jitter=backoff.full_jitter,
+        on_backoff=lambda details: logger.warning(
+            "Retrying API call (attempt %s/%s)", details["tries"], MAX_LLM_TRIES
+        )
+    )
+    async def aquery_llm(self, query: str) -> str:
+        """
+        Async variant of query_llm built on aiohttp.
+
+        Multiple coroutines can have queries in flight concurrently on a
+        single shared session, so batch analysis overlaps network latency
+        instead of paying one round-trip per prompt.
+
+        Args:
+            query: The prompt to send to the language model
+
+        Returns:
+            str: The response from the language model
+
+        Raises:
+            APIKeyError: If the API key is invalid
+            APIConnectionError: If connection to the API fails
+            APIResponseError: If the API response is invalid
+            RateLimitError: If the API rate limit is exceeded
+        """
+        logger.info(f"Querying ASI1 LLM asynchronously (length: {len(query)} chars)")
+
+        data = {
+            "messages": [{"role": "user", "content": query}],
+            "conversationId": self.config.conversation_id,
+            "model": self.config.model
+        }
+
+        # Serve identical prompts from the cache instead of the network
+        cache_key = LLMCache.key_for(data)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("LLM cache hit; skipping API call")
+            return cached
+
+        session = await self._get_aio_session()
+
+        try:
+            async with session.post(
+                self.config.api_url,
+                data=orjson.dumps(data),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            ) as response:
+                if response.status == 401:
+                    logger.error("API key unauthorized")
+                    raise APIKeyError("Invalid API key")
+
+                elif response.status == 429:
+                    logger.warning("API rate limit exceeded")
+                    raise RateLimitError("API rate limit exceeded, retrying with backoff")
+
+                elif response.status != 200:
+                    body = await response.text()
+                    logger.error(f"API returned error status code: {response.status}")
+                    raise APIResponseError(f"API returned error: {response.status} - {body}")
+
+                output = orjson.loads(await response.read())
+
+            # Probe the expected structure directly
+            content = _extract_content(output)
+            logger.info(f"Received valid response (length: {len(content)} chars)")
+            self.cache.set(cache_key, content)
+            return content
+
+        except asyncio.TimeoutError:
+            logger.error(f"Request timed out after {self.config.timeout} seconds")
+            raise APIConnectionError(f"Request timed out after {self.config.timeout} seconds")
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Connection error: {e}")
+            raise APIConnectionError(f"Failed to connect to ASI1 API: {e}")
+
     def extract_trading_signal(self, response: str) -> TradingSignal:
         """
         Extract a trading signal (BUY/SELL/HOLD) from the LLM response.
-        
+
+        The scan is a single case-insensitive regex pass over the response,
+        so no upper-cased copy of the (potentially long) text is allocated.
+
         Args:
             response: The response from the language model
-            
+
         Returns:
             TradingSignal: The extracted trading signal
         """
-        response_upper = response.upper()
-        
-        if "BUY" in response_upper:
-            logger.info("Extracted BUY signal from response")
-            return TradingSignal.BUY
-        
-        elif "SELL" in response_upper:
-            logger.info("Extracted SELL signal from response")
-            return TradingSignal.SELL
-        
-        elif "HOLD" in response_upper:
-            logger.info("Extracted HOLD signal from response")
-            return TradingSignal.HOLD
-        
-        else:
+        match = _SIGNAL_RE.search(response)
+
+        if match is None:
             logger.warning(f"Could not extract clear trading signal from response: {response}")
             return TradingSignal.UNKNOWN
+
+        signal = TradingSignal[match.group(1).upper()]
+        logger.info(f"Extracted {signal.value} signal from response")
+        return signal
     
     def analyze_market_data(
         self,
@@ -293,20 +521,59 @@ class ASI1Service:
             TradingSignal: The recommended trading action
         """
         # Construct the prompt
-        prompt = f"""    
-        Consider the following factors:
-        
-        Fear Greed Index Analysis - {fgi_data}
-        Coin Market Data - {coin_data}
-        User's type of investing - {investor_type}
-        User's risk strategy - {risk_strategy}
-        
-        Most recent crypto news - {news_data}
-        
-        You are a crypto expert, who is assisting the user to make the most meaningful decisions, to gain the most revenue. 
-        Given the following information, respond with one word, either "SELL", "BUY" or "HOLD" native token from {blockchain} network.
-        """
-        
+        prompt = self._build_market_prompt(
+            coin_data, fgi_data, news_data, investor_type, risk_strategy, blockchain
+        )
+
         # Query the LLM and extract the trading signal
         response = self.query_llm(prompt)
-        return self.extract_trading_signal(response) 
\ No newline at end of file
+        return self.extract_trading_signal(response)
+
+    async def aanalyze_market_data(self, snapshots: List[Dict[str, Any]]) -> List[TradingSignal]:
+        """
+        Analyze several market snapshots concurrently.
+
+        The prompts are sent with asyncio.gather over the shared aiohttp
+        session, so the total latency is roughly one round-trip instead of
+        one per snapshot.
+
+        Args:
+            snapshots: A list of dicts, each holding the keyword arguments
+                       accepted by analyze_market_data
+
+        Returns:
+            List[TradingSignal]: One recommended trading action per snapshot
+        """
+        prompts = [self._build_market_prompt(**snapshot) for snapshot in snapshots]
+        responses = await asyncio.gather(*[self.aquery_llm(prompt) for prompt in prompts])
+        return [self.extract_trading_signal(response) for response in responses]
+
+    @staticmethod
+    def _build_market_prompt(
+        coin_data: Dict[str, Any],
+        fgi_data: Dict[str, Any],
+        news_data: Dict[str, Any],
+        investor_type: str,
+        risk_strategy: str,
+        blockchain: str
+    ) -> str:
+        """Build the market-analysis prompt shared by the sync and async paths."""
+        return MARKET_PROMPT_TEMPLATE.format_map({
+            "fgi": orjson.dumps(fgi_data).decode(),
+            "coin": orjson.dumps(coin_data).decode(),
+            "news": orjson.dumps(news_data).decode(),
+            "investor": investor_type,
+            "risk": risk_strategy,
+            "chain": blockchain,
+        }) 
+
+@functools.lru_cache(maxsize=1)
+def get_asi1_service() -> ASI1Service:
+    """
+    Return the process-wide ASI1Service instance.
+
+    Constructing the service per request would rebuild the HTTP pool,
+    response cache and configuration each time; the singleton keeps one
+    long-lived connection pool shared by all callers.
+    """
+    return ASI1Service()
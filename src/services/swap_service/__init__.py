@@ -4,7 +4,12 @@ Swap Services Package
 This package provides services for cryptocurrency swaps on Uniswap.
 """
 
-from .eth_usdc import ETHUSDCSwapService
-from .usdc_eth import USDCETHSwapService
+from .eth_usdc import ETHUSDCSwapService, get_eth_usdc_swap_service
+from .usdc_eth import USDCETHSwapService, get_usdc_eth_swap_service
 
-__all__ = ["ETHUSDCSwapService", "USDCETHSwapService"] 
\ No newline at end of file
+__all__ = [
+    "ETHUSDCSwapService",
+    "USDCETHSwapService",
+    "get_eth_usdc_swap_service",
+    "get_usdc_eth_swap_service",
+] 
\ No newline at end of file
@@ -6,12 +6,18 @@ This module provides functionality for swapping ETH to USDC on Uniswap
 on the Base network.
 """
 
+import functools
+import json
 import logging
 import os
+import time
 from decimal import Decimal
 from typing import Dict, Any, Optional, Tuple
 
+import backoff
+import requests
 from web3 import Web3, Account
+from web3.exceptions import TimeExhausted
 from uniswap_universal_router_decoder import FunctionRecipient, RouterCodec
 
 from ...utils.errors import BlockchainError, ConfigurationError
@@ -24,20 +30,78 @@ from ...config.settings import (
     BASE_CHAIN_ID
 )
 
+# ABI for ERC20 token (for USDC), parsed once at import time
+ERC20_ABI = json.loads('[{"constant":true,"inputs":[],"name":"name","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_spender","type":"address"},{"name":"_value","type":"uint256"}],"name":"approve","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"totalSupply","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_from","type":"address"},{"name":"_to","type":"address"},{"name":"_value","type":"uint256"}],"name":"transferFrom","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"decimals","outputs":[{"name":"","type":"uint8"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_owner","type":"address"}],"name":"balanceOf","outputs":[{"name":"balance","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[],"name":"symbol","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_to","type":"address"},{"name":"_value","type":"uint256"}],"name":"transfer","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_owner","type":"address"},{"name":"_spender","type":"address"}],"name":"allowance","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"payable":true,"stateMutability":"payable","type":"fallback"},{"anonymous":false,"inputs":[{"indexed":true,"name":"owner","type":"address"},{"indexed":true,"name":"spender","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"Approval","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"name":"from","type":"address"},{"indexed":true,"name":"to","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"Transfer","type":"event"}]')
+
+# USDC has a fixed number of decimals on Base; reading it over RPC on every
+# service init is a wasted round-trip
+USDC_DECIMALS = 6
+
+# Checksummed token and router addresses, computed once at import time.
+# to_checksum_address runs keccak256 over the address string, so doing it
+# per-instance repeats the hashing for compile-time constants.
+USDC_ADDRESS_CS = Web3.to_checksum_address(USDC_ADDRESS)
+WETH_ADDRESS_CS = Web3.to_checksum_address(WETH_ADDRESS)
+ROUTER_ADDRESS_CS = Web3.to_checksum_address(UNIVERSAL_ROUTER_ADDRESS)
+
+# Uniswap v3 QuoterV2 on Base, used as the ETH/USDC price oracle
+QUOTER_ADDRESS = "0x3d4e44Eb1374240CE5F1B871ab261CD16335B76a"
+QUOTER_ADDRESS_CS = Web3.to_checksum_address(QUOTER_ADDRESS)
+QUOTER_ABI = json.loads('[{"inputs":[{"components":[{"internalType":"address","name":"tokenIn","type":"address"},{"internalType":"address","name":"tokenOut","type":"address"},{"internalType":"uint256","name":"amountIn","type":"uint256"},{"internalType":"uint24","name":"fee","type":"uint24"},{"internalType":"uint160","name":"sqrtPriceLimitX96","type":"uint160"}],"internalType":"struct IQuoterV2.QuoteExactInputSingleParams","name":"params","type":"tuple"}],"name":"quoteExactInputSingle","outputs":[{"internalType":"uint256","name":"amountOut","type":"uint256"},{"internalType":"uint160","name":"sqrtPriceX96After","type":"uint160"},{"internalType":"uint32","name":"initializedTicksCrossed","type":"uint32"},{"internalType":"uint256","name":"gasEstimate","type":"uint256"}],"stateMutability":"nonpayable","type":"function"}]')
+
+# WETH/USDC 0.05% pool fee tier used for price quotes
+QUOTE_POOL_FEE = 500
+
+# How long a quoted ETH price stays fresh; rapid-fire estimates within this
+# window reuse the cached value instead of another RPC
+ETH_PRICE_TTL = 15.0
+
+# Retry policy for the read-only RPC calls that precede a swap. Base RPC
+# endpoints routinely shed load with transient errors; full jitter keeps
+# many agent instances from retrying in lockstep. send_raw_transaction is
+# deliberately NOT retried (resubmitting a signed tx is not idempotent).
+RPC_MAX_TRIES = 4
+RPC_MAX_WAIT = 5.0
+_RPC_TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, TimeExhausted)
+
+# Sentinel words used to locate the mutable fields inside the pre-encoded
+# router calldata. A word of 32 repeated bytes cannot collide with the fixed
+# commands, path or recipient words of the WETH -> USDC swap shape.
+_TPL_AMOUNT_SENTINEL = int.from_bytes(b"\xa1" * 32, "big")
+_TPL_MIN_OUT_SENTINEL = int.from_bytes(b"\xb2" * 32, "big")
+_TPL_DEADLINE_SENTINEL = int.from_bytes(b"\xc3" * 32, "big")
+
+
+def _log_rpc_retry(details: Dict[str, Any]) -> None:
+    """Log a retried pre-send RPC read so retry storms are visible."""
+    logging.getLogger("service.swap.eth_usdc").warning(
+        "Transient RPC error, retrying (attempt %s): %s",
+        details["tries"],
+        details["exception"],
+    )
+
 
 class ETHUSDCSwapService:
     """
     Service for handling ETH to USDC swap operations on Uniswap.
     """
     
-    def __init__(self, ethereum_rpc_url: str = None, private_key: str = None):
+    def __init__(
+        self,
+        ethereum_rpc_url: str = None,
+        private_key: str = None,
+        verify_connection: bool = False
+    ):
         """
         Initialize the ETH to USDC swap service.
-        
+
         Args:
             ethereum_rpc_url: Optional RPC URL override
             private_key: Optional private key override
-        
+            verify_connection: Probe the RPC endpoint during construction.
+                Off by default so init stays I/O-free; the first real call
+                surfaces connectivity problems as a BlockchainError.
+
         Raises:
             ConfigurationError: If required configuration is missing
         """
@@ -54,43 +118,68 @@ class ETHUSDCSwapService:
         if not self.private_key:
             raise ConfigurationError("Ethereum private key not provided")
         
-        # Initialize Web3 provider
-        self.web3 = Web3(Web3.HTTPProvider(self.ethereum_rpc_url))
-        if not self.web3.is_connected():
+        # Initialize Web3 provider with a shared keep-alive session so the
+        # JSON-RPC calls inside a swap reuse one connection to the node
+        self._rpc_session = requests.Session()
+        self.web3 = Web3(Web3.HTTPProvider(self.ethereum_rpc_url, session=self._rpc_session))
+
+        # The liveness probe costs an RPC round-trip, so it is opt-in;
+        # normally the first real call validates the connection instead
+        if verify_connection and not self.web3.is_connected():
             raise ConfigurationError(f"Could not connect to Ethereum node at {self.ethereum_rpc_url}")
         
         # Initialize account
         self.account = Account.from_key(self.private_key)
         self.logger.info(f"Initialized with account: {self.account.address}")
         
-        # Set token addresses
-        self.usdc_address = Web3.to_checksum_address(USDC_ADDRESS)
-        self.weth_address = Web3.to_checksum_address(WETH_ADDRESS)
-        self.router_address = Web3.to_checksum_address(UNIVERSAL_ROUTER_ADDRESS)
+        # Set token addresses from the pre-checksummed module constants
+        self.usdc_address = USDC_ADDRESS_CS
+        self.weth_address = WETH_ADDRESS_CS
+        self.router_address = ROUTER_ADDRESS_CS
         self.chain_id = BASE_CHAIN_ID
         
         # Initialize contracts and decoder
         self._initialize_contracts()
         self.codec = RouterCodec()
+
+        # The swap shape (wrap + v2 WETH -> USDC, payer is router) is fixed,
+        # so encode the router calldata once and splice the three words that
+        # change per swap instead of re-running the codec builder chain
+        self._swap_path = [self.weth_address, self.usdc_address]
+        self._swap_template: Optional[bytes] = None
+        self._swap_template_offsets: Dict[str, Tuple[int, ...]] = {}
+        try:
+            self._build_swap_template()
+        except Exception as e:
+            # Codec internals changed shape; per-call encoding still works
+            self.logger.debug("Router calldata template unavailable: %s", e)
     
     def _initialize_contracts(self) -> None:
         """
         Initialize smart contract interfaces.
-        
+
         Sets up the USDC token and other necessary contracts.
         """
-        # ABI for ERC20 token (for USDC)
-        erc20_abi = '[{"constant":true,"inputs":[],"name":"name","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_spender","type":"address"},{"name":"_value","type":"uint256"}],"name":"approve","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"totalSupply","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_from","type":"address"},{"name":"_to","type":"address"},{"name":"_value","type":"uint256"}],"name":"transferFrom","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"decimals","outputs":[{"name":"","type":"uint8"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[{"name":"_owner","type":"address"}],"name":"balanceOf","outputs":[{"name":"balance","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":true,"inputs":[],"name":"symbol","outputs":[{"name":"","type":"string"}],"payable":false,"stateMutability":"view","type":"function"},{"constant":false,"inputs":[{"name":"_to","type":"address"},{"name":"_value","type":"uint256"}],"name":"transfer","outputs":[{"name":"","type":"bool"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"name":"_owner","type":"address"},{"name":"_spender","type":"address"}],"name":"allowance","outputs":[{"name":"","type":"uint256"}],"payable":false,"stateMutability":"view","type":"function"},{"payable":true,"stateMutability":"payable","type":"fallback"},{"anonymous":false,"inputs":[{"indexed":true,"name":"owner","type":"address"},{"indexed":true,"name":"spender","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"Approval","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"name":"from","type":"address"},{"indexed":true,"name":"to","type":"address"},{"indexed":false,"name":"value","type":"uint256"}],"name":"Transfer","type":"event"}]'
-        
-        # Initialize USDC contract
+        # Initialize USDC contract from the module-level ABI
         self.usdc_contract = self.web3.eth.contract(
             address=self.usdc_address,
-            abi=erc20_abi
+            abi=ERC20_ABI
         )
-        
-        # Get USDC decimals
-        self.usdc_decimals = self.usdc_contract.functions.decimals().call()
+
+        # USDC decimals are fixed on Base, so avoid an RPC per init
+        self.usdc_decimals = USDC_DECIMALS
+        self._usdc_scale = 10 ** USDC_DECIMALS
         self.logger.debug(f"USDC decimals: {self.usdc_decimals}")
+
+        # Uniswap quoter used as the ETH/USDC price oracle
+        self.quoter = self.web3.eth.contract(
+            address=QUOTER_ADDRESS_CS,
+            abi=QUOTER_ABI
+        )
+
+        # Price cache: (monotonic timestamp, micro-USDC per ETH); see
+        # ETH_PRICE_TTL
+        self._eth_price_cache: Optional[Tuple[float, int]] = None
     
     def get_eth_balance(self) -> float:
         """
@@ -111,30 +200,219 @@ class ETHUSDCSwapService:
             float: The USDC balance in USDC units
         """
         usdc_balance_raw = self.usdc_contract.functions.balanceOf(self.account.address).call()
-        usdc_balance = usdc_balance_raw / (10 ** self.usdc_decimals)
+        usdc_balance = usdc_balance_raw / self._usdc_scale
         return float(usdc_balance)
     
+    def _get_eth_price_u6(self) -> int:
+        """
+        Get the current ETH price in USDC atomic units (micro-USDC).
+
+        Quotes 1 WETH -> USDC through the 0.05% pool and caches the result
+        for ETH_PRICE_TTL seconds, so bursts of estimate calls cost one RPC.
+        The integer quoter output is kept as-is so downstream amount math
+        stays in exact bigint arithmetic.
+
+        Returns:
+            int: The current ETH price in micro-USDC per ETH
+
+        Raises:
+            BlockchainError: If the price cannot be retrieved
+        """
+        now = time.monotonic()
+        if self._eth_price_cache is not None:
+            cached_at, cached_u6 = self._eth_price_cache
+            if now - cached_at < ETH_PRICE_TTL:
+                return cached_u6
+
+        try:
+            amount_out, *_ = self.quoter.functions.quoteExactInputSingle((
+                self.weth_address,
+                self.usdc_address,
+                10 ** 18,  # 1 ETH in wei
+                QUOTE_POOL_FEE,
+                0,  # no price limit
+            )).call()
+
+            self._eth_price_cache = (now, amount_out)
+
+            self.logger.debug("Quoted ETH price: %d micro-USDC", amount_out)
+            return amount_out
+
+        except Exception as e:
+            self.logger.error(f"Error fetching ETH price from quoter: {e}")
+            raise BlockchainError(f"Failed to get ETH price: {e}")
+
     def get_eth_price(self) -> float:
         """
         Get the current ETH price in USDC.
-        
+
         Returns:
             float: The current ETH price in USDC
-            
+
         Raises:
             BlockchainError: If the price cannot be retrieved
         """
+        return self._get_eth_price_u6() / self._usdc_scale
+
+    def _estimate_output_u6(self, amount_in_wei: int, slippage: float) -> Tuple[int, int]:
+        """
+        Estimate the USDC output for a swap in atomic units.
+
+        All arithmetic is exact bigint work (wei in, micro-USDC out), so no
+        floating-point rounding can drift the on-chain amountOutMin.
+
+        Args:
+            amount_in_wei: Amount of ETH to swap in wei
+            slippage: Maximum acceptable slippage as a fraction
+
+        Returns:
+            Tuple[int, int]: Estimated and minimum USDC output in micro-USDC
+        """
+        price_u6 = self._get_eth_price_u6()
+        estimated_u6 = amount_in_wei * price_u6 // 10 ** 18
+
+        # Slippage applied in basis points to stay in integer arithmetic
+        slippage_bps = int(slippage * 10_000)
+        min_u6 = estimated_u6 * (10_000 - slippage_bps) // 10_000
+
+        return estimated_u6, min_u6
+    
+    def _chain_swap_input(self, amount_in_wei: int, min_amount_out: int, deadline: int) -> str:
+        """
+        Encode the router calldata through the codec builder chain.
+
+        Args:
+            amount_in_wei: Amount of ETH to swap in wei
+            min_amount_out: Minimum USDC output in micro-USDC
+            deadline: Unix deadline for the swap
+
+        Returns:
+            str: Hex-encoded Universal Router calldata
+        """
+        return (
+            self.codec
+            .encode
+            .chain()
+            .wrap_eth(FunctionRecipient.ROUTER, amount_in_wei)
+            .v2_swap_exact_in(
+                FunctionRecipient.SENDER,
+                amount_in_wei,
+                min_amount_out,
+                self._swap_path,
+                payer_is_sender=False
+            )
+            .build(deadline)
+        )
+
+    def _build_swap_template(self) -> None:
+        """
+        Pre-encode the router calldata with sentinel values.
+
+        Runs the codec chain once with recognisable sentinel words, then
+        records where the amount, minimum output and deadline live in the
+        encoded bytes so later swaps can splice real values in place of
+        re-walking the builder chain.
+
+        Raises:
+            ValueError: If a sentinel cannot be located in the calldata
+        """
+        encoded = self._chain_swap_input(
+            _TPL_AMOUNT_SENTINEL, _TPL_MIN_OUT_SENTINEL, _TPL_DEADLINE_SENTINEL
+        )
+        raw = bytes.fromhex(encoded[2:]) if isinstance(encoded, str) else bytes(encoded)
+
+        offsets: Dict[str, Tuple[int, ...]] = {}
+        for name, sentinel in (
+            ("amount", _TPL_AMOUNT_SENTINEL),
+            ("min_out", _TPL_MIN_OUT_SENTINEL),
+            ("deadline", _TPL_DEADLINE_SENTINEL),
+        ):
+            word = sentinel.to_bytes(32, "big")
+            positions = []
+            start = raw.find(word)
+            while start != -1:
+                positions.append(start)
+                start = raw.find(word, start + 32)
+            if not positions:
+                raise ValueError(f"Sentinel for {name} not found in encoded calldata")
+            offsets[name] = tuple(positions)
+
+        self._swap_template = raw
+        self._swap_template_offsets = offsets
+
+    def _encode_swap_input(self, amount_in_wei: int, min_amount_out: int, deadline: int) -> str:
+        """
+        Build the Universal Router calldata for a WETH -> USDC swap.
+
+        Uses the pre-encoded template when available, substituting only the
+        three words that change per swap; otherwise falls back to the full
+        codec chain.
+
+        Args:
+            amount_in_wei: Amount of ETH to swap in wei
+            min_amount_out: Minimum USDC output in micro-USDC
+            deadline: Unix deadline for the swap
+
+        Returns:
+            str: Hex-encoded Universal Router calldata
+        """
+        if self._swap_template is None:
+            return self._chain_swap_input(amount_in_wei, min_amount_out, deadline)
+
+        buf = bytearray(self._swap_template)
+        for name, value in (
+            ("amount", amount_in_wei),
+            ("min_out", min_amount_out),
+            ("deadline", deadline),
+        ):
+            word = value.to_bytes(32, "big")
+            for offset in self._swap_template_offsets[name]:
+                buf[offset:offset + 32] = word
+
+        return "0x" + buf.hex()
+
+    @backoff.on_exception(
+        backoff.expo,
+        _RPC_TRANSIENT_ERRORS,
+        max_tries=RPC_MAX_TRIES,
+        max_value=RPC_MAX_WAIT,
+        jitter=backoff.full_jitter,
+        on_backoff=_log_rpc_retry,
+    )
+    def _fetch_swap_context(self) -> Tuple[int, int, int, int]:
+        """
+        Fetch the account state needed to build a swap in one batched RPC.
+
+        The four reads (balance, nonce, gas price, priority fee) are
+        independent, so issuing them as a single JSON-RPC batch pays one
+        network round-trip instead of four sequential ones; endpoints
+        without batch support get sequential calls instead. Transient RPC
+        failures are retried with full-jitter backoff; these reads are
+        idempotent, unlike the transaction submission itself.
+
+        Returns:
+            Tuple[int, int, int, int]: Balance in wei, transaction count,
+            gas price and max priority fee
+        """
         try:
-            # Import here to avoid circular imports
-            from ...services.llm_service import get_eth_price as fetch_price
-            return fetch_price()
+            with self.web3.batch_requests() as batch:
+                batch.add(self.web3.eth.get_balance(self.account.address))
+                batch.add(self.web3.eth.get_transaction_count(self.account.address))
+                batch.add(self.web3.eth.gas_price)
+                batch.add(self.web3.eth.max_priority_fee)
+                balance_wei, nonce, gas_price, priority_fee = batch.execute()
+        except _RPC_TRANSIENT_ERRORS:
+            # Let the backoff decorator handle connection-level hiccups
+            raise
         except Exception as e:
-            self.logger.warning(f"Failed to get ETH price from LLM service: {e}")
-            
-            # Fallback: Use a reasonable estimate (this should be replaced with a proper price oracle)
-            # In a production system, you would use a reliable price oracle
-            return 3000.0  # Approximate ETH price in USD
-    
+            self.logger.debug("Batch RPC unavailable, using sequential reads: %s", e)
+            balance_wei = self.web3.eth.get_balance(self.account.address)
+            nonce = self.web3.eth.get_transaction_count(self.account.address)
+            gas_price = self.web3.eth.gas_price
+            priority_fee = self.web3.eth.max_priority_fee
+
+        return balance_wei, nonce, gas_price, priority_fee
+
     def estimate_usdc_output(self, eth_amount: float, slippage: float = 0.01) -> Tuple[float, float]:
         """
         Estimate the amount of USDC that will be received for a given ETH input.
@@ -150,19 +428,17 @@ class ETHUSDCSwapService:
             BlockchainError: If the estimation fails
         """
         try:
-            # Get current ETH price
-            eth_price = self.get_eth_price()
-            
-            # Calculate expected USDC output (ETH amount * price)
-            estimated_usdc = eth_amount * eth_price
-            
-            # Apply slippage to get minimum output
-            min_usdc_output = estimated_usdc * (1 - slippage)
-            
+            # Do the math in atomic units, converting only at the boundary
+            amount_in_wei = self.web3.to_wei(eth_amount, 'ether')
+            estimated_u6, min_u6 = self._estimate_output_u6(amount_in_wei, slippage)
+
+            estimated_usdc = estimated_u6 / self._usdc_scale
+            min_usdc_output = min_u6 / self._usdc_scale
+
             self.logger.info(f"Estimated {eth_amount} ETH -> ~{estimated_usdc:.2f} USDC (min: {min_usdc_output:.2f})")
-            
+
             return estimated_usdc, min_usdc_output
-            
+
         except Exception as e:
             self.logger.error(f"Error estimating USDC output: {e}")
             raise BlockchainError(f"Failed to estimate USDC output: {e}")
@@ -200,45 +476,28 @@ class ETHUSDCSwapService:
             if eth_amount <= 0:
                 raise ValueError("ETH amount must be greater than 0")
                 
+            # Fetch balance, nonce and fee data in a single batched round-trip
+            balance_wei, nonce, base_fee, priority_fee = self._fetch_swap_context()
+
             # Check if account has enough ETH
-            eth_balance = self.get_eth_balance()
+            eth_balance = float(self.web3.from_wei(balance_wei, 'ether'))
             if eth_amount > eth_balance:
                 raise ValueError(f"Insufficient ETH balance. Have {eth_balance}, need {eth_amount}")
             
             # Convert ETH amount to wei
             amount_in_wei = self.web3.to_wei(eth_amount, 'ether')
+
+            # Estimate USDC output in atomic units; min_amount_out goes
+            # on-chain, so it must stay exact integer math throughout
+            estimated_u6, min_amount_out = self._estimate_output_u6(amount_in_wei, slippage)
             
-            # Estimate USDC output
-            _, min_usdc_output = self.estimate_usdc_output(eth_amount, slippage)
-            
-            # Convert min output to USDC units with decimals
-            min_amount_out = int(min_usdc_output * (10 ** self.usdc_decimals))
-            
-            # Define token path
-            path = [self.weth_address, self.usdc_address]
-            
-            # Encode swap transaction using the router codec
-            encoded_input = (
-                self.codec
-                .encode
-                .chain()
-                .wrap_eth(FunctionRecipient.ROUTER, amount_in_wei)
-                .v2_swap_exact_in(
-                    FunctionRecipient.SENDER, 
-                    amount_in_wei, 
-                    min_amount_out, 
-                    path, 
-                    payer_is_sender=False
-                )
-                .build(self.codec.get_default_deadline())
+            # Encode the swap calldata, splicing into the cached template
+            # where possible
+            encoded_input = self._encode_swap_input(
+                amount_in_wei, min_amount_out, self.codec.get_default_deadline()
             )
             
-            # Get current nonce
-            nonce = self.web3.eth.get_transaction_count(self.account.address)
-            
-            # Get gas price
-            base_fee = self.web3.eth.gas_price
-            priority_fee = self.web3.eth.max_priority_fee
+            # Derive fee caps from the batched reads
             max_priority_fee = int(priority_fee * priority_fee_multiplier)
             max_fee = base_fee * 2
             
@@ -267,8 +526,8 @@ class ETHUSDCSwapService:
             return {
                 "transaction_hash": tx_hash_hex,
                 "eth_amount": eth_amount,
-                "estimated_usdc": min_usdc_output / (1 - slippage),  # Reverse the slippage calculation
-                "min_usdc_output": min_usdc_output,
+                "estimated_usdc": estimated_u6 / self._usdc_scale,
+                "min_usdc_output": min_amount_out / self._usdc_scale,
                 "status": "pending"
             }
             
@@ -313,4 +572,14 @@ class ETHUSDCSwapService:
             
         except Exception as e:
             self.logger.error(f"Error checking transaction status for {tx_hash}: {e}")
-            raise BlockchainError(f"Failed to check transaction status: {e}") 
\ No newline at end of file
+            raise BlockchainError(f"Failed to check transaction status: {e}") 
+
+@functools.lru_cache(maxsize=1)
+def get_eth_usdc_swap_service() -> ETHUSDCSwapService:
+    """
+    Return the process-wide ETHUSDCSwapService instance.
+
+    Instantiation pays for provider setup and contract wiring; the
+    singleton shares one Web3 connection across all callers.
+    """
+    return ETHUSDCSwapService()
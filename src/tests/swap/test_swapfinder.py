@@ -3,17 +3,22 @@
 Test for Swapfinder Agent
 
 This module provides a test client for the Swapfinder agent functionality.
-It sets up a Flask server to receive and handle swap requests and responses.
+It sets up a FastAPI server to receive and handle swap requests and responses.
 The Swapfinder agent uses AI reasoning to determine the best swap agent for a transaction.
 """
 
 import logging
 import os
 import sys
+import threading
+from collections import deque
 from threading import Thread
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from uagents_core.crypto import Identity
 from fetchai.registration import register_with_agentverse
 from fetchai.communication import parse_message_from_agent, send_message_to_agent
@@ -31,19 +36,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-flask_app = Flask(__name__)
-CORS(flask_app)
+# Initialize FastAPI app; async handlers let the server overlap webhook
+# fan-in instead of serialising requests like the Flask dev server did
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # Client identity for Agentverse
 client_identity = None
 
-# Store for agent response
-agent_response = None
+# Bounded store of received agent responses, newest last. The swap agent
+# protocol carries no correlation id, so responses are kept in arrival
+# order; the bound stops unconsumed webhook traffic from growing memory.
+_responses = deque(maxlen=256)
+_responses_lock = threading.Lock()
 
 # Load environment variables
 load_dotenv()
 
+# Schema digest for SwapRequest, computed once; digesting re-serialises the
+# JSON schema and hashes it, which is wasted work per request
+_SWAP_REQUEST_DIGEST = Model.build_schema_digest(SwapRequest)
+
 
 def init_client():
     """Initialize and register the client agent with Agentverse."""
@@ -96,11 +114,11 @@ def init_client():
         raise
 
 
-@flask_app.route('/send_request', methods=['POST'])
-def send_request():
+@app.post('/send_request')
+async def send_request(request: Request):
     """
     Send a test swap request to the Swapfinder agent.
-    
+
     Expected JSON payload:
     {
         "blockchain": "base",
@@ -108,12 +126,9 @@ def send_request():
         "amount": 100.0
     }
     """
-    global agent_response
-    agent_response = None
-    
     try:
-        # Get request data
-        data = request.json
+        # Get request data; orjson accepts the raw bytes directly
+        data = orjson.loads(await request.body())
         
         # Create swap request
         swap_request = SwapRequest(
@@ -125,63 +140,61 @@ def send_request():
         # Target agent address - the Swapfinder agent
         target_agent = "agent1q2kxet8hcvyzk34xvd7n8ue24p9hdygqlz98p32p0s6dqths0yazwpqe9fg"
         
-        # Create model digest
-        model_digest = Model.build_schema_digest(SwapRequest)
-        
         # Send message to agent
         send_message_to_agent(
             client_identity,
             target_agent,
             swap_request.dict(),
-            model_digest=model_digest
+            model_digest=_SWAP_REQUEST_DIGEST
         )
         
         logger.info(f"Sent swap request to {target_agent}: {swap_request}")
         
-        return jsonify({
+        return {
             "status": "request_sent",
             "request": swap_request.dict()
-        })
-        
+        }
+
     except Exception as e:
         logger.error(f"Error sending swap request: {e}")
-        return jsonify({
-            "status": "error",
-            "message": str(e)
-        }), 500
+        return ORJSONResponse(
+            status_code=500,
+            content={"status": "error", "message": str(e)}
+        )
 
 
-@flask_app.route('/api/webhook', methods=['POST'])
-def webhook():
+@app.post('/api/webhook')
+async def webhook(request: Request):
     """Handle incoming webhook messages from the Swapfinder agent."""
-    global agent_response
-    
     try:
         # Parse incoming message
-        data = request.get_data().decode("utf-8")
+        data = (await request.body()).decode("utf-8")
         logger.info("Received response from Swapfinder agent")
-        
+
         # Parse agent message
         message = parse_message_from_agent(data)
-        agent_response = message.payload
-        
-        logger.info(f"Processed response: {agent_response}")
-        
-        return jsonify({"status": "success"})
-        
+        with _responses_lock:
+            _responses.append(message.payload)
+
+        logger.info(f"Processed response: {message.payload}")
+
+        return {"status": "success"}
+
     except Exception as e:
         logger.error(f"Error in webhook: {e}")
-        return jsonify({"error": str(e)}), 500
+        return ORJSONResponse(status_code=500, content={"error": str(e)})
 
 
-@flask_app.route('/last_response', methods=['GET'])
-def get_last_response():
-    """Get the last response received from the Swapfinder agent."""
-    global agent_response
-    
-    return jsonify({
-        "response": agent_response
-    })
+@app.get('/last_response')
+async def get_last_response():
+    """Get the responses received from the Swapfinder agent, newest last."""
+    with _responses_lock:
+        responses = list(_responses)
+
+    return {
+        "response": responses[-1] if responses else None,
+        "responses": responses
+    }
 
 
 def run_test_server():
@@ -189,15 +202,11 @@ def run_test_server():
     # Initialize client
     init_client()
     
-    # Start Flask server in a separate thread
-    Thread(
-        target=lambda: flask_app.run(
-            host="0.0.0.0",
-            port=5004,
-            debug=False,
-            use_reloader=False
-        )
-    ).start()
+    # Start the ASGI server in a separate thread so the REPL below keeps
+    # the main thread
+    config = uvicorn.Config(app, host="0.0.0.0", port=5004, log_level="info")
+    server = uvicorn.Server(config)
+    Thread(target=server.run, daemon=True).start()
     
     logger.info("Test server running on http://localhost:5004")
     logger.info("Send POST requests to /send_request to test the Swapfinder agent")
@@ -3,16 +3,24 @@
 Test for USDC to ETH Swap
 
 This module provides a test client for the USDC to ETH swap functionality.
-It sets up a Flask server to receive and handle swap requests and responses.
+It sets up a FastAPI server to receive and handle swap requests and responses.
 """
 
+import asyncio
 import logging
 import os
 import sys
+import threading
+from collections import deque
 from threading import Thread
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import orjson
+import requests
+import uvicorn
+from requests.adapters import HTTPAdapter
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from uagents_core.crypto import Identity
 from fetchai.registration import register_with_agentverse
 from fetchai.communication import parse_message_from_agent, send_message_to_agent
@@ -30,19 +38,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-flask_app = Flask(__name__)
-CORS(flask_app)
+# Initialize FastAPI app; async handlers let webhook deliveries and
+# outbound sends overlap instead of queueing behind the single-threaded
+# Flask dev server this script previously used
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # Client identity for Agentverse
 client_identity = None
 
-# Store for agent response
-agent_response = None
+# Single-slot mailbox for the latest agent response. deque.append and
+# indexing are atomic under the GIL, so webhook writers and /last_response
+# readers never observe a torn update the way a bare global could; with
+# maxlen=1 a new response simply displaces the previous one.
+_mailbox = deque(maxlen=1)
+
+# Signals arrival of a response so /wait_response can block instead of
+# forcing clients to poll /last_response over HTTP
+_response_arrived = asyncio.Event()
 
 # Load environment variables
 load_dotenv()
 
+# Schema digest for SwapRequest, computed once; digesting re-serialises the
+# JSON schema and hashes it, which is wasted work per request
+_SWAP_REQUEST_DIGEST = Model.build_schema_digest(SwapRequest)
+
+# Pooled session for the interactive REPL below; keep-alive means the
+# second and later commands reuse the loopback connection instead of
+# paying a fresh TCP connect each time
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive"})
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Outbound send batching: requests arriving within BATCH_WINDOW seconds are
+# coalesced and drained by a single timer-thread flush, so a burst of N
+# /send_request calls costs one thread wake-up instead of N and the SDK's
+# pooled connection is reused back-to-back. The swap agent only speaks
+# SwapRequest, so each message is still delivered individually; the batching
+# is purely client-side.
+BATCH_WINDOW = 0.05
+_pending = []
+_pending_lock = threading.Lock()
+_flush_timer = None
+
+
+def _flush_pending():
+    """Drain and send every swap request queued since the timer was armed."""
+    global _flush_timer
+    with _pending_lock:
+        batch = _pending[:]
+        _pending.clear()
+        _flush_timer = None
+
+    for target_agent, payload, model_digest in batch:
+        try:
+            send_message_to_agent(
+                client_identity,
+                target_agent,
+                payload,
+                model_digest=model_digest
+            )
+            logger.info(f"Sent swap request to {target_agent}: {payload}")
+        except Exception as e:
+            logger.error(f"Error sending batched swap request: {e}")
+
+
+def _enqueue_send(target_agent, payload, model_digest):
+    """Queue an outbound message and arm the flush timer on first enqueue."""
+    global _flush_timer
+    with _pending_lock:
+        _pending.append((target_agent, payload, model_digest))
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(BATCH_WINDOW, _flush_pending)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
 
 def init_client():
     """Initialize and register the client agent with Agentverse."""
@@ -51,7 +127,7 @@ def init_client():
         # Create identity from seed
         client_identity = Identity.from_seed("usdc_to_eth_test_seed_phrase", 0)
         logger.info(f"Test client started with address: {client_identity.address}")
-        
+
         # Create README for agent registration
         readme = """
 ![tag:swapland](https://img.shields.io/badge/swaplandbaseusdceth-1)
@@ -70,7 +146,7 @@ def init_client():
     </payload>
 </payload_requirements>
 """
-        
+
         # Register with Agentverse
         register_with_agentverse(
             identity=client_identity,
@@ -79,19 +155,19 @@ def init_client():
             agent_title="Test Client for USDC to ETH Swap",
             readme=readme
         )
-        
+
         logger.info("Test client registration complete")
-        
+
     except Exception as e:
         logger.error(f"Initialization error: {e}")
         raise
 
 
-@flask_app.route('/send_request', methods=['POST'])
-def send_request():
+@app.post('/send_request')
+async def send_request(request: Request):
     """
     Send a test swap request to the USDC to ETH agent.
-    
+
     Expected JSON payload:
     {
         "blockchain": "base",
@@ -99,97 +175,104 @@ def send_request():
         "amount": 100
     }
     """
-    global agent_response
-    agent_response = None
-    
+    # Discard any stale response before sending a new request
+    _mailbox.clear()
+    _response_arrived.clear()
+
     try:
-        # Get request data
-        data = request.json
-        
+        # Get request data; orjson accepts the raw bytes directly
+        data = orjson.loads(await request.body())
+
         # Create swap request
         swap_request = SwapRequest(
             blockchain=data.get("blockchain", "base"),
             signal=data.get("signal", "buy"),
             amount=float(data.get("amount", 100))
         )
-        
+
         # Target agent address - the USDC to ETH agent
         target_agent = "agent1q22x5cgwmn06rkhnn883npzwyc77d2pjhwqt9mmrjyn64ztrlhepcx4qwht"
-        
-        # Create model digest
-        model_digest = Model.build_schema_digest(SwapRequest)
-        
-        # Send message to agent
-        send_message_to_agent(
-            client_identity,
-            target_agent,
-            swap_request.dict(),
-            model_digest=model_digest
-        )
-        
-        logger.info(f"Sent swap request to {target_agent}: {swap_request}")
-        
-        return jsonify({
-            "status": "request_sent",
+
+        # Queue the message; the flush timer drains the batch off the event
+        # loop, so the synchronous fetchai SDK never blocks a handler
+        _enqueue_send(target_agent, swap_request.dict(), _SWAP_REQUEST_DIGEST)
+
+        logger.info(f"Queued swap request for {target_agent}: {swap_request}")
+
+        return {
+            "status": "request_queued",
             "request": swap_request.dict()
-        })
-        
+        }
+
     except Exception as e:
         logger.error(f"Error sending swap request: {e}")
-        return jsonify({
-            "status": "error",
-            "message": str(e)
-        }), 500
+        return ORJSONResponse(
+            status_code=500,
+            content={"status": "error", "message": str(e)}
+        )
 
 
-@flask_app.route('/api/webhook', methods=['POST'])
-def webhook():
+@app.post('/api/webhook')
+async def webhook(request: Request):
     """Handle incoming webhook messages from the swap agent."""
-    global agent_response
-    
     try:
-        # Parse incoming message
-        data = request.get_data().decode("utf-8")
+        # Read the raw body; the envelope parser validates JSON through
+        # pydantic, which accepts bytes, so the full-buffer UTF-8 decode is
+        # usually unnecessary. Fall back to decoding for SDK versions that
+        # insist on str.
+        raw = await request.body()
         logger.info("Received response from swap agent")
-        
+
         # Parse agent message
-        message = parse_message_from_agent(data)
-        agent_response = message.payload
-        
-        logger.info(f"Processed response: {agent_response}")
-        
-        return jsonify({"status": "success"})
-        
+        try:
+            message = parse_message_from_agent(raw)
+        except (TypeError, AttributeError):
+            message = parse_message_from_agent(raw.decode("utf-8"))
+        _mailbox.append(message.payload)
+        _response_arrived.set()
+
+        logger.info(f"Processed response: {message.payload}")
+
+        return {"status": "success"}
+
     except Exception as e:
         logger.error(f"Error in webhook: {e}")
-        return jsonify({"error": str(e)}), 500
+        return ORJSONResponse(status_code=500, content={"error": str(e)})
 
 
-@flask_app.route('/last_response', methods=['GET'])
-def get_last_response():
+@app.get('/last_response')
+async def get_last_response():
     """Get the last response received from the swap agent."""
-    global agent_response
-    
-    return jsonify({
-        "response": agent_response
-    })
+    return {
+        "response": _mailbox[-1] if _mailbox else None
+    }
+
+
+@app.get('/wait_response')
+async def wait_response(timeout: float = 5.0):
+    """Block until the next agent response arrives or the timeout lapses."""
+    try:
+        await asyncio.wait_for(_response_arrived.wait(), timeout)
+    except asyncio.TimeoutError:
+        return ORJSONResponse(status_code=504, content={"response": None})
+
+    _response_arrived.clear()
+    return {
+        "response": _mailbox[-1] if _mailbox else None
+    }
 
 
 def run_test_server():
     """Run the test server."""
     # Initialize client
     init_client()
-    
-    # Start Flask server in a separate thread
-    Thread(
-        target=lambda: flask_app.run(
-            host="0.0.0.0",
-            port=5003,
-            debug=False,
-            use_reloader=False
-        )
-    ).start()
-    
+
+    # Start the ASGI server in a separate thread so the REPL below keeps
+    # the main thread
+    config = uvicorn.Config(app, host="0.0.0.0", port=5003, log_level="info")
+    server = uvicorn.Server(config)
+    Thread(target=server.run, daemon=True).start()
+
     logger.info("Test server running on http://localhost:5003")
     logger.info("Send POST requests to /send_request to test the USDC to ETH swap agent")
     logger.info("GET /last_response to get the last response received from the agent")
@@ -198,7 +281,7 @@ def run_test_server():
 if __name__ == "__main__":
     try:
         run_test_server()
-        
+
         # Keep the main thread running
         while True:
             cmd = input("> ")
@@ -208,8 +291,7 @@ if __name__ == "__main__":
                 amount = input("Enter USDC amount: ")
                 try:
                     # Make a manual request
-                    import requests
-                    response = requests.post(
+                    response = _SESSION.post(
                         "http://localhost:5003/send_request",
                         json={
                             "blockchain": "base",
@@ -222,16 +304,15 @@ if __name__ == "__main__":
                     print(f"Error: {e}")
             elif cmd.lower() == "response":
                 try:
-                    import requests
-                    response = requests.get("http://localhost:5003/last_response")
+                    response = _SESSION.get("http://localhost:5003/last_response")
                     print(f"Last response: {response.json()}")
                 except Exception as e:
                     print(f"Error: {e}")
             else:
                 print("Unknown command. Available commands: exit, send, response")
-                
+
     except KeyboardInterrupt:
         logger.info("Test server stopped by user")
     except Exception as e:
         logger.error(f"Error running test server: {e}")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
@@ -10,6 +10,8 @@ from typing import Optional, Any, Dict
 
 class BaseError(Exception):
     """Base exception class for the application."""
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         self.message = message
         self.details = details or {}
@@ -21,70 +23,80 @@ class BaseError(Exception):
 
 class APIError(BaseError):
     """Raised when there's an error with an external API call."""
-    pass
+    __slots__ = ()
 
 
 class MessageHandlingError(BaseError):
     """Raised when there's an error handling an agent message."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(BaseError):
     """Raised when there's an error with agent configuration."""
-    pass
+    __slots__ = ()
 
 
 class BlockchainError(BaseError):
     """Raised when there's an error with blockchain operations."""
-    pass
+    __slots__ = ()
 
 
 class CommunicationError(BaseError):
     """Exception raised for inter-agent communication errors."""
-    pass
+    __slots__ = ()
 
 
 class DataValidationError(BaseError):
     """Exception raised for data validation errors."""
-    pass
+    __slots__ = ()
 
 
 class SwapError(BaseError):
     """Exception raised for swap-related errors."""
-    pass
+    __slots__ = ()
 
 
 class LLMError(BaseError):
     """Exception raised for LLM (AI) related errors."""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(BaseError):
     """Exception raised for authentication errors."""
-    pass
+    __slots__ = ()
+
+
+def _format_base_error(error: BaseError) -> Dict[str, Any]:
+    """Format a BaseError subclass, preserving its message and details."""
+    return {
+        "error": error.__class__.__name__,
+        "message": error.message,
+        "details": error.details
+    }
+
+
+def _format_generic(error: Exception) -> Dict[str, Any]:
+    """Format an exception that carries no structured details."""
+    return {
+        "error": error.__class__.__name__,
+        "message": str(error),
+        "details": {}
+    }
+
+
+# Dispatch table mapping exception type to its formatter; an exact-type
+# lookup replaces the isinstance walk on the error-reporting path
+_FORMATTERS = {cls: _format_base_error for cls in (BaseError, *BaseError.__subclasses__())}
 
 
 def format_error(error: Exception) -> Dict[str, Any]:
     """
     Format an exception into a standardized error dictionary.
-    
+
     Args:
         error: The exception to format
-        
+
     Returns:
         Dict: Formatted error information
     """
-    if isinstance(error, CryptoAgentError):
-        result = {
-            "error": error.__class__.__name__,
-            "message": error.message,
-            "details": error.details
-        }
-    else:
-        result = {
-            "error": error.__class__.__name__,
-            "message": str(error),
-            "details": {}
-        }
-    
-    return result 
\ No newline at end of file
+    return _FORMATTERS.get(type(error), _format_generic)(error)
\ No newline at end of file
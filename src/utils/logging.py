@@ -5,12 +5,25 @@ Logging Utilities
 This module provides standardized logging functionality for the application.
 """
 
+import functools
 import logging
 import os
+import queue
 import sys
 import traceback
-from logging.handlers import RotatingFileHandler
-from typing import List, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional, Set
+
+# Log directories already created this process; makedirs stats the path
+# even when it exists, so remember what has been ensured
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process, skipping the syscall after."""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 
 def configure_logging(
@@ -40,23 +53,40 @@ def configure_logging(
     # Get or create logger
     logger = logging.getLogger(logger_name)
     logger.setLevel(log_level)
-    
+
+    # Agent loggers are children of one shared "agent" root: handlers are
+    # installed on the root once and children propagate records up, so each
+    # record is formatted by one handler set no matter how many agents run
+    # in the process
+    if logger_name.startswith("agent."):
+        logger.propagate = True
+        target = logging.getLogger("agent")
+        target_name = "agent"
+    else:
+        target = logger
+        target_name = logger_name
+
+    # Already configured: reattaching handlers would make every record
+    # format and write once per configuration call
+    if target.handlers:
+        return logger
+
     # Create formatter
     formatter = logging.Formatter(log_format)
-    
+
     # Create console handler
     console_handler = logging.StreamHandler(stream=sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    handlers = [console_handler]
+
     # Create file handler if requested
     if log_to_file:
         # Use provided log file or create one based on logger name
         if log_file is None:
             log_dir = "logs"
-            os.makedirs(log_dir, exist_ok=True)
-            log_file = os.path.join(log_dir, f"{logger_name}.log")
-        
+            _ensure_dir(log_dir)
+            log_file = os.path.join(log_dir, f"{target_name}.log")
+
         # Create rotating file handler
         file_handler = RotatingFileHandler(
             filename=log_file,
@@ -65,31 +95,47 @@ def configure_logging(
             encoding="utf-8"
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    # Prevent propagation to avoid duplicate logs
-    logger.propagate = False
-    
+        handlers.append(file_handler)
+
+    # Route records through a queue so logging calls only pay a queue.put;
+    # the listener thread does the actual console/file writes and rotation
+    # checks off the caller's path
+    log_queue: queue.Queue = queue.Queue(-1)
+    target.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    # Keep a reference so callers can stop the listener at shutdown
+    target._qlistener = listener
+
+    # Prevent propagation past the handler-owning logger to avoid
+    # duplicate logs
+    target.propagate = False
+
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_agent_logger(agent_name: str, log_level: int = logging.INFO) -> logging.Logger:
     """
     Get a logger configured specifically for an agent.
-    
+
+    Repeated calls with the same agent name return the already-configured
+    logger instead of re-running configuration. Agent loggers propagate to
+    the shared "agent" root, whose handlers write logs/agent.log.
+
     Args:
         agent_name: The name of the agent
         log_level: The logging level (default: INFO)
-        
+
     Returns:
         logging.Logger: The configured logger for the agent
     """
-    # Sanitize agent name for use in the log file name
+    # Sanitize agent name for use in the logger name
     sanitized_name = agent_name.lower().replace(" ", "_")
     return configure_logging(
         logger_name=f"agent.{sanitized_name}",
-        log_level=log_level,
-        log_file=f"logs/{sanitized_name}_agent.log"
+        log_level=log_level
     )
 
 
@@ -108,7 +154,10 @@ def log_exception(
     """
     error_cls = exception.__class__.__name__
     error_msg = str(exception)
-    error_tb = traceback.format_exc()
-    
-    logger.error(f"{message}: {error_cls} - {error_msg}")
-    logger.debug(f"Error traceback:\n{error_tb}") 
\ No newline at end of file
+
+    logger.error("%s: %s - %s", message, error_cls, error_msg)
+
+    # Formatting the traceback walks the whole frame stack; skip it when
+    # the record would be filtered out anyway
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Error traceback:\n%s", traceback.format_exc())
\ No newline at end of file
